@@ -38,13 +38,13 @@ impl Api {
         .await?;
         dejsonify::<T>(&resp).map_err(|e| anyhow!("Failed to dejsonify: {}", e))
     }
-    async fn post<T>(&self, path: String, body: String) -> Result<T>
+    async fn post<T>(&self, path: String, body: &str) -> Result<T>
     where
         T: DeserializeOwned,
     {
         let resp = post::<String>(
             format!("{}/{}", self.api_url, path).as_str(),
-            body.as_str(),
+            body,
             Some(
                 vec![
                     ("x-api-key".to_string(), self.api_key.clone()),
@@ -122,16 +122,27 @@ impl Api {
     }
 
     pub async fn submit_algorithm(&self, req: SubmitAlgorithmReq) -> Result<SubmitAlgorithmResp> {
-        self.post("submit-algorithm".to_string(), jsonify(&req))
+        self.post("submit-algorithm".to_string(), &jsonify(&req))
             .await
     }
 
     pub async fn submit_benchmark(&self, req: SubmitBenchmarkReq) -> Result<SubmitBenchmarkResp> {
-        self.post("submit-benchmark".to_string(), jsonify(&req))
-            .await
+        self.submit_benchmark_jsonified(&jsonify(&req)).await
+    }
+
+    // takes an already jsonified SubmitBenchmarkReq so retries skip re-serialisation
+    // (the body is still copied into each outgoing request)
+    pub async fn submit_benchmark_jsonified(&self, body: &str) -> Result<SubmitBenchmarkResp> {
+        self.post("submit-benchmark".to_string(), body).await
     }
 
     pub async fn submit_proof(&self, req: SubmitProofReq) -> Result<SubmitProofResp> {
-        self.post("submit-proof".to_string(), jsonify(&req)).await
+        self.submit_proof_jsonified(&jsonify(&req)).await
+    }
+
+    // takes an already jsonified SubmitProofReq so retries skip re-serialisation
+    // (the body is still copied into each outgoing request)
+    pub async fn submit_proof_jsonified(&self, body: &str) -> Result<SubmitProofResp> {
+        self.post("submit-proof".to_string(), body).await
     }
 }
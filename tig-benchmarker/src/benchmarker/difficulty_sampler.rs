@@ -50,7 +50,7 @@ impl DifficultySampler {
         // samples an index from the distribution
         let idx = self
             .distribution
-            .clone()
+            .as_ref()
             .expect("You must update sampler first")
             .sample(rng);
 
@@ -1,23 +1,36 @@
 use super::{Job, Result};
-use crate::future_utils::Mutex;
+use crate::future_utils::{time, Mutex};
 use once_cell::sync::OnceCell;
 use std::collections::HashMap;
 use tig_utils::get;
 
-static CACHE: OnceCell<Mutex<HashMap<String, Vec<u8>>>> = OnceCell::new();
+const MAX_CACHED_WASMS: usize = 8;
+
+// algorithm_id -> (last used time, wasm blob)
+static CACHE: OnceCell<Mutex<HashMap<String, (u64, Vec<u8>)>>> = OnceCell::new();
 
 pub async fn execute(job: &Job) -> Result<Vec<u8>> {
     let mut cache = CACHE
         .get_or_init(|| Mutex::new(HashMap::new()))
         .lock()
         .await;
-    if let Some(wasm_blob) = cache.get(&job.settings.algorithm_id) {
+    if let Some((last_used, wasm_blob)) = cache.get_mut(&job.settings.algorithm_id) {
+        *last_used = time();
         Ok(wasm_blob.clone())
     } else {
         let wasm = get::<Vec<u8>>(&job.download_url, None)
             .await
             .map_err(|e| format!("Failed to download wasm from {}: {:?}", job.download_url, e))?;
-        (*cache).insert(job.settings.algorithm_id.clone(), wasm.clone());
+        if cache.len() >= MAX_CACHED_WASMS {
+            // evict the least recently used blob so the cache stays bounded
+            let lru_id = cache
+                .iter()
+                .min_by_key(|(_, (last_used, _))| *last_used)
+                .map(|(id, _)| id.clone())
+                .unwrap();
+            cache.remove(&lru_id);
+        }
+        (*cache).insert(job.settings.algorithm_id.clone(), (time(), wasm.clone()));
         Ok(wasm)
     }
 }
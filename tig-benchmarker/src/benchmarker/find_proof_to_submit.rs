@@ -1,14 +1,20 @@
-use super::{state, QueryData, Result};
+use super::{state, QueryData, Result, State};
 use std::collections::HashSet;
 use tig_worker::SolutionData;
 
-pub async fn execute() -> Result<Option<(String, Vec<SolutionData>)>> {
-    let QueryData {
-        proofs,
-        benchmarks,
-        frauds,
+pub async fn execute() -> Result<Vec<(String, Vec<SolutionData>)>> {
+    let State {
+        query_data:
+            QueryData {
+                proofs,
+                benchmarks,
+                frauds,
+                ..
+            },
+        submission_errors,
         ..
-    } = &mut state().lock().await.query_data;
+    } = &mut (*state().lock().await);
+    let mut proofs_to_submit = Vec::new();
     for (benchmark_id, proof) in proofs.iter_mut() {
         if proof.solutions_data.is_none() || frauds.contains_key(benchmark_id) {
             continue;
@@ -20,15 +26,19 @@ pub async fn execute() -> Result<Option<(String, Vec<SolutionData>)>> {
             solutions_data.retain(|x| sampled_nonces.contains(&x.nonce));
             let extracted_nonces: HashSet<u64> = solutions_data.iter().map(|x| x.nonce).collect();
             if extracted_nonces != sampled_nonces {
-                return Err(format!(
-                    "No solutions for sampled nonces: '{:?}'",
-                    sampled_nonces
-                        .difference(&extracted_nonces)
-                        .collect::<Vec<_>>()
-                ));
+                submission_errors.insert(
+                    benchmark_id.clone(),
+                    format!(
+                        "No solutions for sampled nonces: '{:?}'",
+                        sampled_nonces
+                            .difference(&extracted_nonces)
+                            .collect::<Vec<_>>()
+                    ),
+                );
+                continue;
             }
-            return Ok(Some((benchmark_id.clone(), solutions_data)));
+            proofs_to_submit.push((benchmark_id.clone(), solutions_data));
         }
     }
-    Ok(None)
+    Ok(proofs_to_submit)
 }
@@ -15,9 +15,10 @@ pub mod run_benchmark;
 
 use crate::future_utils::{sleep, spawn, time, Mutex};
 use difficulty_sampler::DifficultySampler;
+use futures::stream::{self, StreamExt};
 use once_cell::sync::OnceCell;
 use serde::{Deserialize, Serialize};
-use std::{collections::HashMap, sync::Arc};
+use std::{collections::HashMap, mem, sync::Arc};
 use tig_api::Api;
 use tig_structs::{
     config::{MinMaxDifficulty, WasmVMConfig},
@@ -26,6 +27,8 @@ use tig_structs::{
 
 pub type Result<T> = std::result::Result<T, String>;
 
+const MAX_CONCURRENT_SUBMISSIONS: usize = 4;
+
 #[derive(Serialize, Clone, Debug)]
 pub struct QueryData {
     pub latest_block: Block,
@@ -194,15 +197,15 @@ async fn run_once(num_workers: u32, ms_per_benchmark: u32) -> Result<()> {
                     .benchmark_submissions
                     .lifespan_period,
             );
-            let mut latest_benchmarks = state.query_data.benchmarks.clone();
+            let mut latest_benchmarks = mem::take(&mut state.query_data.benchmarks);
             latest_benchmarks.retain(|_, x| x.details.block_started >= block_started_cutoff);
             latest_benchmarks.extend(new_query_data.benchmarks.drain());
 
-            let mut latest_proofs = state.query_data.proofs.clone();
+            let mut latest_proofs = mem::take(&mut state.query_data.proofs);
             latest_proofs.retain(|id, _| latest_benchmarks.contains_key(id));
             latest_proofs.extend(new_query_data.proofs.drain());
 
-            let mut latest_frauds = state.query_data.frauds.clone();
+            let mut latest_frauds = mem::take(&mut state.query_data.frauds);
             latest_frauds.retain(|id, _| latest_benchmarks.contains_key(id));
             latest_frauds.extend(new_query_data.frauds.drain());
 
@@ -235,19 +238,35 @@ async fn run_once(num_workers: u32, ms_per_benchmark: u32) -> Result<()> {
         }
     }
 
-    update_status("Finding proof to submit").await;
-    match find_proof_to_submit::execute().await? {
-        Some((benchmark_id, solutions_data)) => {
-            update_status(&format!("Submitting proof for {}", benchmark_id)).await;
-            if let Err(e) = submit_proof::execute(benchmark_id.clone(), solutions_data).await {
-                let mut state = state().lock().await;
-                state.submission_errors.insert(benchmark_id, e.clone());
-                return Err(e);
+    update_status("Finding proofs to submit").await;
+    let proofs_to_submit = find_proof_to_submit::execute().await?;
+    if proofs_to_submit.is_empty() {
+        update_status("No proof to submit").await;
+    } else {
+        update_status(&format!("Submitting {} proofs", proofs_to_submit.len())).await;
+        let results: Vec<(String, Result<()>)> = stream::iter(proofs_to_submit)
+            .map(|(benchmark_id, solutions_data)| async move {
+                let result = submit_proof::execute(benchmark_id.clone(), solutions_data).await;
+                (benchmark_id, result)
+            })
+            .buffer_unordered(MAX_CONCURRENT_SUBMISSIONS)
+            .collect()
+            .await;
+        let mut error = None;
+        for (benchmark_id, result) in results {
+            match result {
+                Ok(_) => {
+                    update_status(&format!("Success. Proof {} submitted", benchmark_id)).await;
+                }
+                Err(e) => {
+                    let mut state = state().lock().await;
+                    state.submission_errors.insert(benchmark_id, e.clone());
+                    error = Some(e);
+                }
             }
-            update_status(&format!("Success. Proof {} submitted", benchmark_id)).await;
         }
-        None => {
-            update_status("No proof to submit").await;
+        if let Some(e) = error {
+            return Err(e);
         }
     }
     // creates a benchmark & proof with job.benchmark_id
@@ -296,7 +315,7 @@ async fn run_once(num_workers: u32, ms_per_benchmark: u32) -> Result<()> {
         (*state).timer = Some(Timer::new(ms_per_benchmark as u64));
     }
     loop {
-        {
+        let ms_to_sleep = {
             // transfers solutions computed by workers to benchmark state
             let num_solutions =
                 drain_solutions(&job.benchmark_id, &mut *(*solutions_data).lock().await).await;
@@ -317,14 +336,17 @@ async fn run_once(num_workers: u32, ms_per_benchmark: u32) -> Result<()> {
                 timer: time_left,
                 ..
             } = &mut (*state().lock().await);
-            if time_left.as_mut().unwrap().update().finished()
+            let timer = time_left.as_mut().unwrap().update();
+            if timer.finished()
                 || (finished && num_solutions == (num_attempts as u32)) // nonce_iter is only empty if recomputing
                 || *status == Status::Stopping
             {
                 break;
             }
-        }
-        sleep(200).await;
+            // wake up when the timer ends rather than overshooting it by up to a full poll
+            (timer.end - timer.now).min(200) as u32
+        };
+        sleep(ms_to_sleep).await;
     }
     for nonce_iter in nonce_iters {
         (*(*nonce_iter).lock().await).empty();
@@ -1,5 +1,6 @@
 use super::{api, state, Job, QueryData, Result, utils::handle_submission_error, query_data::query_latest_block};
 use tig_api::SubmitBenchmarkReq;
+use tig_utils::jsonify;
 
 const MAX_RETRIES: u32 = 3;
 
@@ -24,11 +25,12 @@ pub async fn execute(job: &Job) -> Result<String> {
         }
     };
 
+    let body = jsonify(&req);
     let mut current_height = query_latest_block().await?.details.height;
 
     for attempt in 1..=MAX_RETRIES {
         println!("Submission attempt {} of {}", attempt, MAX_RETRIES);
-        match api().submit_benchmark(req.clone()).await {
+        match api().submit_benchmark_jsonified(&body).await {
             Ok(resp) => {
                 return match resp.verified {
                     Ok(_) => Ok(resp.benchmark_id),
@@ -36,13 +38,13 @@ pub async fn execute(job: &Job) -> Result<String> {
                 }
             }
             Err(e) => {
-                let err_msg = format!("Failed to submit benchmark after {} attempts: {:?}", attempt, e);
-                if attempt < MAX_RETRIES {
-                    if !handle_submission_error(&e, "benchmark", &mut current_height).await {
-                        return Err(err_msg);
-                    }
-                } else {
-                    return Err(err_msg);
+                if attempt == MAX_RETRIES
+                    || !handle_submission_error(&e, "benchmark", &mut current_height).await
+                {
+                    return Err(format!(
+                        "Failed to submit benchmark after {} attempts: {:?}",
+                        attempt, e
+                    ));
                 }
             }
         }
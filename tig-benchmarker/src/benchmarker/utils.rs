@@ -6,10 +6,9 @@ const WAIT_TIME_MS: u32 = 5000;
 const LOG_INTERVAL_SECS: u64 = 10;
 
 pub async fn handle_submission_error(e: &anyhow::Error, submit_name: &str, current_height: &mut u32) -> bool {
-    let err_msg = format!("Failed to submit {}: {:?}", submit_name, e);
-    
     if let Some(err_str) = e.downcast_ref::<String>() {
-        if err_str.to_lowercase().contains("high transaction volume") {
+        let err_str = err_str.to_lowercase();
+        if err_str.contains("high transaction volume") {
             println!("High transaction volume detected. Waiting for a new block...");
 
             let start_time = Instant::now();
@@ -32,15 +31,15 @@ pub async fn handle_submission_error(e: &anyhow::Error, submit_name: &str, curre
                     /* Do Nothing */
                 }
             }
-        } else if err_str.to_lowercase().contains("proof already submitted") {
+        } else if err_str.contains("proof already submitted") {
             return false;
         } else {
-            println!("{}", err_msg);
+            println!("Failed to submit {}: {:?}", submit_name, e);
             println!("Retrying in {} seconds...", WAIT_TIME_MS / 1000);
             sleep(WAIT_TIME_MS).await;
         }
     } else {
-        println!("{}", err_msg);
+        println!("Failed to submit {}: {:?}", submit_name, e);
         println!("Retrying in {} seconds...", WAIT_TIME_MS / 1000);
         sleep(WAIT_TIME_MS).await;
     }
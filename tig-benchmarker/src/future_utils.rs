@@ -7,7 +7,10 @@ use std::future::Future;
 #[cfg(feature = "standalone")]
 mod utils {
     use super::*;
-    use std::time::{SystemTime, UNIX_EPOCH};
+    use std::{
+        sync::OnceLock,
+        time::{Instant, SystemTime, UNIX_EPOCH},
+    };
     pub use tokio::sync::Mutex;
     use tokio::{join, task, time};
 
@@ -39,10 +42,19 @@ mod utils {
     }
 
     pub fn time() -> u64 {
-        SystemTime::now()
-            .duration_since(UNIX_EPOCH)
-            .unwrap()
-            .as_millis() as u64
+        // anchored to the wall clock once, then advanced by a monotonic clock so
+        // that elapsed time computed from it never goes backwards
+        static START: OnceLock<(Instant, u64)> = OnceLock::new();
+        let (instant, ms) = START.get_or_init(|| {
+            (
+                Instant::now(),
+                SystemTime::now()
+                    .duration_since(UNIX_EPOCH)
+                    .unwrap()
+                    .as_millis() as u64,
+            )
+        });
+        ms + instant.elapsed().as_millis() as u64
     }
 }
 
@@ -6,9 +6,10 @@ mod future_utils;
 use benchmarker::{Job, NonceIterator};
 use clap::{value_parser, Arg, Command};
 use future_utils::{sleep, Mutex};
-use std::{collections::HashMap, fs, path::PathBuf, sync::Arc};
+use std::{collections::HashMap, path::PathBuf, sync::Arc};
 use tig_structs::core::*;
 use tig_utils::{dejsonify, get, jsonify, post};
+use tokio::fs;
 use warp::Filter;
 
 fn cli() -> Command {
@@ -139,10 +140,17 @@ async fn slave_node(master: &String, port: u16, num_workers: u32) {
                 let job = next_job.as_ref().unwrap();
                 println!("Starting new job: {:?}", job);
                 println!(
-                    "Downloading algorithm {}",
+                    "Downloading algorithm {} and getting nonce offset from master",
                     job.download_url.split("/").last().unwrap()
                 );
-                let wasm = match benchmarker::download_wasm::execute(job).await {
+                // independent requests, so overlap them instead of paying both round trips
+                let nonce_offset_url =
+                    format!("{}/nonce_offset/{:?}", master_url, hostname::get().unwrap());
+                let (wasm, offset) = tokio::join!(
+                    benchmarker::download_wasm::execute(job),
+                    get::<String>(&nonce_offset_url, None)
+                );
+                let wasm = match wasm {
                     Ok(wasm) => wasm,
                     Err(e) => {
                         println!("Error downloading wasm: {:?}", e);
@@ -150,14 +158,7 @@ async fn slave_node(master: &String, port: u16, num_workers: u32) {
                         continue;
                     }
                 };
-
-                println!("Getting nonce offset from master");
-                let offset = match get::<String>(
-                    &format!("{}/nonce_offset/{:?}", master_url, hostname::get().unwrap()),
-                    None,
-                )
-                .await
-                {
+                let offset = match offset {
                     Ok(resp) => dejsonify::<u64>(&resp).unwrap(),
                     Err(e) => {
                         println!("Error getting nonce offset: {:?}", e);
@@ -278,7 +279,7 @@ async fn master_node(
     });
     loop {
         let selection = serde_json::from_str::<HashMap<String, String>>(
-            &fs::read_to_string(algorithms_path).unwrap(),
+            &fs::read_to_string(algorithms_path).await.unwrap(),
         )
         .unwrap();
         for (challenge_id, algorithm_id) in selection {
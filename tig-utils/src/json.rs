@@ -17,12 +17,29 @@ pub fn jsonify<T>(obj: &T) -> String
 where
     T: Serialize,
 {
-    to_string(&jsonify_internal(
-        &to_value(obj).expect("to_value failed on serializable object"),
+    to_string(&sort_keys(
+        to_value(obj).expect("to_value failed on serializable object"),
     ))
     .expect("to_string failed on serializable object")
 }
 
+// same ordering as jsonify_internal, but moves entries instead of deep cloning
+fn sort_keys(json_value: Value) -> Value {
+    match json_value {
+        Value::Object(obj) => {
+            let mut entries: Vec<(String, Value)> = obj.into_iter().collect();
+            entries.sort_unstable_by(|a, b| a.0.cmp(&b.0));
+            Value::Object(
+                entries
+                    .into_iter()
+                    .map(|(key, value)| (key, sort_keys(value)))
+                    .collect(),
+            )
+        }
+        _ => json_value,
+    }
+}
+
 pub fn jsonify_internal(json_value: &Value) -> Value {
     match json_value {
         Value::Object(obj) => {
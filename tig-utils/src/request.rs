@@ -129,8 +129,12 @@ mod request {
     use super::*;
     use reqwest::{
         header::{HeaderMap, HeaderName, HeaderValue},
-        Response,
+        Client, Response,
     };
+    use std::sync::OnceLock;
+
+    // shared so that connections (and TLS sessions) are pooled across requests
+    static CLIENT: OnceLock<Client> = OnceLock::new();
 
     #[allow(async_fn_in_trait)]
     pub trait FromResponse: Sized {
@@ -167,7 +171,7 @@ mod request {
         body: Option<String>,
         headers: Option<HeaderMap>,
     ) -> Result<T> {
-        let client = reqwest::Client::new();
+        let client = CLIENT.get_or_init(Client::new);
         let mut request_builder = client.request(method.parse().unwrap(), url);
 
         if let Some(b) = body {
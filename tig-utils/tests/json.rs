@@ -0,0 +1,24 @@
+use serde_json::json;
+use tig_utils::{dejsonify, jsonify, jsonify_internal};
+
+#[test]
+fn test_jsonify_sorts_keys() {
+    let value = json!({"b": 1, "a": {"d": [{"z": 1, "y": 2}], "c": null}});
+    assert_eq!(
+        jsonify(&value),
+        r#"{"a":{"c":null,"d":[{"z":1,"y":2}]},"b":1}"#
+    );
+}
+
+#[test]
+fn test_jsonify_matches_jsonify_internal() {
+    let value = json!({"nonce": 7, "merkle": ["ab", "cd"], "data": {"y": 1.5, "x": true}});
+    assert_eq!(
+        jsonify(&value),
+        serde_json::to_string(&jsonify_internal(&value)).unwrap()
+    );
+    assert_eq!(
+        dejsonify::<serde_json::Value>(&jsonify(&value)).unwrap(),
+        value
+    );
+}